@@ -12,12 +12,14 @@ Features:
 
 import os
 import json
+from collections import defaultdict
+import pandas as pd
 import streamlit as st
 import requests
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
-from orders import OrderSystem, Order, OrderItem
+from orders import OrderSystem, Order, OrderItem, read_json_file, write_json_file
 from relay_logic import RelaySystem, Location
 
 
@@ -34,10 +36,8 @@ def analyze_inbound_products() -> Optional[Dict]:
     """
     try:
         # Load products and orders data
-        with open("products.json", 'r') as f:
-            products_data = json.load(f)
-        with open("orders.json", 'r') as f:
-            orders_data = json.load(f)
+        products_data = read_json_file("products.json")
+        orders_data = load_orders_data("orders.json", os.path.getmtime("orders.json"))
         
         # Create product lookup for efficient access
         products_lookup = {p['product_number']: p for p in products_data}
@@ -110,7 +110,6 @@ def cleanup_old_order_files():
     """Clean up duplicate order files from previous runs."""
     try:
         import glob
-        import os
 
         # Find all order files
         order_files = glob.glob("all_orders_*.json") + glob.glob("confirmed_orders_*.json") + glob.glob("orders_*.json")
@@ -208,7 +207,7 @@ def create_orders_for_date_and_day(order_date: str, order_day: str, max_products
             save_orders_with_confirmation(orders, order_date.strip(), day_num)
 
         # Get dates from in-memory system
-        dates = sorted(set(o.order_date.split(" ")[0] for o in order_system.get_all_orders()))
+        dates = sorted({o.date_only for o in order_system.iter_orders()})
 
         return f"{msg}\nCreated {len(orders)} orders for {order_date} Day {day_num} with up to {max_products} products per route.\n\nOrders saved to JSON file with confirmed date/day for relay generation.", dates
 
@@ -256,12 +255,9 @@ def create_relay_from_orders_data(orders_data: List[Dict]) -> List[Location]:
     """
     try:
         # Group orders by location
-        location_orders = {}
+        location_orders = defaultdict(list)
         for order_data in orders_data:
-            location = order_data.get('location', 'Unknown')
-            if location not in location_orders:
-                location_orders[location] = []
-            location_orders[location].append(order_data)
+            location_orders[order_data.get('location', 'Unknown')].append(order_data)
 
         # Create Location objects from orders
         locations = []
@@ -296,6 +292,88 @@ def create_relay_from_orders_data(orders_data: List[Dict]) -> List[Location]:
         return []
 
 
+@st.cache_data(show_spinner=False, max_entries=1)
+def load_orders_data(path: str, mtime: float) -> List[Dict]:
+    """
+    Load order dictionaries from an orders JSON file.
+    
+    Cached on (path, mtime), so the file is only parsed again when it has
+    changed on disk. Only the latest version is kept, since older entries
+    are never requested again.
+    
+    Args:
+        path: Path to the orders JSON file
+        mtime: Modification time of the file (cache key)
+        
+    Returns:
+        List of order dictionaries
+    """
+    return read_json_file(path)
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def build_relay(path: str, mtime: float) -> List[Location]:
+    """
+    Build relay locations from an orders JSON file.
+    
+    Cached on (path, mtime), so the relay is only rebuilt when the file
+    has changed on disk; the file itself is parsed through load_orders_data.
+    Only the latest relay is kept, since older entries are never requested again.
+    
+    Args:
+        path: Path to the orders JSON file
+        mtime: Modification time of the file (cache key)
+        
+    Returns:
+        List of Location objects with assigned trailers
+    """
+    orders_data = load_orders_data(path, mtime)
+
+    # Convert JSON orders back to Order objects for relay system
+    orders = []
+    for order_data in orders_data:
+        # Create OrderItem objects from JSON data
+        items = []
+        for item_data in order_data['items']:
+            item = OrderItem(
+                product_number=item_data['product_number'],
+                product_name=item_data['product_name'],
+                units_ordered=item_data['units_ordered'],
+                units_per_tray=item_data['units_per_tray'],
+                trays_needed=item_data['trays_needed'],
+                stack_height=item_data['stack_height'],
+                stacks_needed=item_data['stacks_needed'],
+                tray_type=item_data['tray_type']
+            )
+            items.append(item)
+
+        # Create Order object from JSON data
+        order = Order(
+            order_id=order_data['order_id'],
+            route_id=order_data['route_id'],
+            location=order_data['location'],
+            order_date=order_data['order_date'],
+            items=items,
+            total_trays=order_data['total_trays'],
+            total_stacks=order_data['total_stacks']
+        )
+        orders.append(order)
+
+    # Create relay from loaded orders
+    # Group orders by location
+    location_orders = defaultdict(list)
+    for order in orders:
+        location_orders[order.location].append(order)
+
+    # Create Location objects from orders
+    locations = []
+    for location_name, location_orders_list in location_orders.items():
+        location = Location.from_orders(location_name, location_orders_list)
+        locations.append(location)
+
+    return locations
+
+
 # ============================================================================
 # API INTEGRATION
 # ============================================================================
@@ -467,38 +545,9 @@ def save_orders_with_confirmation(orders: List[Order], date_str: str, day_num: i
             except Exception as e:
                 print(f"Error deleting {old_file}: {e}")
 
-        # Convert orders to JSON-serializable format
-        orders_data = []
-        for order in orders:
-            order_dict = {
-                "order_id": order.order_id,
-                "route_id": order.route_id,
-                "location": order.location,
-                "order_date": order.order_date,
-                "total_trays": order.total_trays,
-                "total_stacks": order.total_stacks,
-                "items": []
-            }
-
-            # Add order items
-            for item in order.items:
-                item_dict = {
-                    "product_number": item.product_number,
-                    "product_name": item.product_name,
-                    "units_ordered": item.units_ordered,
-                    "units_per_tray": item.units_per_tray,
-                    "trays_needed": item.trays_needed,
-                    "stack_height": item.stack_height,
-                    "stacks_needed": item.stacks_needed,
-                    "tray_type": item.tray_type
-                }
-                order_dict["items"].append(item_dict)
-
-            orders_data.append(order_dict)
-
         # Create data structure with metadata
         file_data = {
-            "orders": orders_data,
+            "orders": orders,  # Order dataclasses serialize natively
             "metadata": {
                 "total_orders": len(orders),
                 "confirmed_date": date_str,
@@ -508,8 +557,7 @@ def save_orders_with_confirmation(orders: List[Order], date_str: str, day_num: i
         }
 
         # Save to JSON file
-        with open(filename, 'w') as f:
-            json.dump(file_data, f, indent=2)
+        write_json_file(filename, file_data)
 
         print(f"Saved {len(orders)} orders to file: {filename}")
 
@@ -529,9 +577,8 @@ st.set_page_config(
 )
 
 # Configure for Render deployment
-import os
-if os.getenv("RENDER"):
-    st.config.set_option("server.port", int(os.getenv("PORT", 10000)))
+if os.environ.get("RENDER"):
+    st.config.set_option("server.port", int(os.environ.get("PORT", 10000)))
     st.config.set_option("server.address", "0.0.0.0")
     st.config.set_option("server.headless", True)
     st.config.set_option("browser.gatherUsageStats", False)
@@ -703,55 +750,19 @@ elif page == "Order Management":
                         # Load existing orders from file
                         existing_orders = []
                         if os.path.exists(filename):
-                            with open(filename, 'r') as f:
-                                existing_orders = json.load(f)
-
-                        # Convert new orders to JSON-serializable format
-                        new_orders_data = []
-                        for order in orders:
-                            order_dict = {
-                                "order_id": order.order_id,
-                                "route_id": order.route_id,
-                                "location": order.location,
-                                "order_date": order.order_date,
-                                "items": [
-                                    {
-                                        "product_number": item.product_number,
-                                        "product_name": item.product_name,
-                                        "units_ordered": item.units_ordered,
-                                        "units_per_tray": item.units_per_tray,
-                                        "trays_needed": item.trays_needed,
-                                        "stack_height": item.stack_height,
-                                        "stacks_needed": item.stacks_needed,
-                                        "tray_type": item.tray_type
-                                    } for item in order.items
-                                ],
-                                "total_trays": order.total_trays,
-                                "total_stacks": order.total_stacks
-                            }
-                            new_orders_data.append(order_dict)
+                            existing_orders = read_json_file(filename)
 
-                        # Combine existing and new orders
-                        all_orders = existing_orders + new_orders_data
+                        # Combine existing and new orders (Order dataclasses serialize natively)
+                        all_orders = existing_orders + orders
 
                         # Save all orders to single file
-                        with open(filename, 'w') as f:
-                            json.dump(all_orders, f, indent=2)
+                        write_json_file(filename, all_orders)
 
-                        st.success(f"💾 {len(new_orders_data)} new orders added to {filename} (Total: {len(all_orders)} orders)")
+                        st.success(f"💾 {len(orders)} new orders added to {filename} (Total: {len(all_orders)} orders)")
 
                     except Exception as e:
                         st.error(f"Error saving orders to file: {str(e)}")
 
-                    # Show summary
-                    location_summary = {}
-                    for order in orders:
-                        if order.location not in location_summary:
-                            location_summary[order.location] = {'orders': 0, 'trays': 0, 'stacks': 0}
-                        location_summary[order.location]['orders'] += 1
-                        location_summary[order.location]['trays'] += order.total_trays
-                        location_summary[order.location]['stacks'] += order.total_stacks
-
                 except ValueError:
                     st.error("Invalid date format. Please use MM/DD/YYYY format.")
                 except Exception as e:
@@ -772,9 +783,9 @@ elif page == "Relay Management":
 
         with col1:
             try:
-                # Load orders from single file
-                with open("orders.json", 'r') as f:
-                    orders_data = json.load(f)
+                # Load orders from single file (parsed only when it changes on disk)
+                orders_mtime = os.path.getmtime("orders.json")
+                orders_data = load_orders_data("orders.json", orders_mtime)
 
                 if not orders_data:
                     st.warning("orders.json is empty. Please generate some random orders first.")
@@ -791,50 +802,9 @@ elif page == "Relay Management":
             if st.button("Create Relay", type="primary"):
                 if orders_data:
                     try:
-                        # Convert JSON orders back to Order objects for relay system
-                        orders = []
-                        for order_data in orders_data:
-                            # Create OrderItem objects from JSON data
-                            items = []
-                            for item_data in order_data['items']:
-                                item = OrderItem(
-                                    product_number=item_data['product_number'],
-                                    product_name=item_data['product_name'],
-                                    units_ordered=item_data['units_ordered'],
-                                    units_per_tray=item_data['units_per_tray'],
-                                    trays_needed=item_data['trays_needed'],
-                                    stack_height=item_data['stack_height'],
-                                    stacks_needed=item_data['stacks_needed'],
-                                    tray_type=item_data['tray_type']
-                                )
-                                items.append(item)
-
-                            # Create Order object from JSON data
-                            order = Order(
-                                order_id=order_data['order_id'],
-                                route_id=order_data['route_id'],
-                                location=order_data['location'],
-                                order_date=order_data['order_date'],
-                                items=items,
-                                total_trays=order_data['total_trays'],
-                                total_stacks=order_data['total_stacks']
-                            )
-                            orders.append(order)
-
-                        # Create relay from loaded orders
-                        # Group orders by location
-                        location_orders = {}
-                        for order in orders:
-                            if order.location not in location_orders:
-                                location_orders[order.location] = []
-                            location_orders[order.location].append(order)
-                        
-                        # Create Location objects from orders
-                        locations = []
-                        for location_name, location_orders_list in location_orders.items():
-                            location = Location.from_orders(location_name, location_orders_list)
-                            locations.append(location)
-                        
+                        # Rebuilt only when orders.json changes on disk
+                        locations = build_relay("orders.json", orders_mtime)
+
                         if locations:
                             st.session_state.current_locations = locations
                             st.success(f"✅ Created relay with {len(locations)} locations")
@@ -865,80 +835,74 @@ elif page == "Relay Management":
                 st.metric("Total Stacks", total_stacks)
             
             for location in st.session_state.current_locations:
-                with st.expander(f"{location.name} - {len(location.trailers)} trailers"):
-                    for trailer in location.trailers:
-                        status = "🟢 Dispatched" if trailer.dispatched else "🔴 Active"
-
-                        # Create a unique key for each trailer
-                        trailer_key = f"current_{location.name}_trailer_{trailer.number}"
-
-                        # Display trailer info with clickable button
-                        col1, col2 = st.columns([3, 1])
-
-                        with col1:
-                            st.write(f"**Trailer #{trailer.number}**: {trailer.stacks} stacks - {status}")
-                            st.write(f"  LD: {trailer.ld_number}")
-                            if trailer.trailer_number:
-                                st.write(f"  Trailer #: {trailer.trailer_number}")
-                            if trailer.seal_number:
-                                st.write(f"  Seal #: {trailer.seal_number}")
-                            if trailer.dispatched and trailer.dispatch_timestamp:
-                                st.write(f"  Dispatched: {trailer.dispatch_timestamp}")
-
-                        with col2:
-                            if not trailer.dispatched:
-                                if st.button("Edit", key=f"edit_{trailer_key}"):
-                                    st.session_state[f"editing_{trailer_key}"] = True
-                            else:
-                                st.write("✅ Dispatched")
-
-                        # Show editing form if this trailer is being edited
-                        if st.session_state.get(f"editing_{trailer_key}", False):
-                            with st.container():
-                                st.markdown("---")
-                                st.subheader(f"Edit Trailer #{trailer.number}")
-
-                                col1, col2 = st.columns(2)
-
-                                with col1:
-                                    new_trailer_number = st.text_input(
-                                        "Trailer Number",
-                                        value=trailer.trailer_number,
-                                        key=f"trailer_num_{trailer_key}"
-                                    )
-
-                                with col2:
-                                    new_seal_number = st.text_input(
-                                        "Seal Number",
-                                        value=trailer.seal_number,
-                                        key=f"seal_num_{trailer_key}"
+                with st.expander(location.display_label):
+                    active_trailers = [t for t in location.trailers if not t.dispatched]
+                    dispatched_trailers = [t for t in location.trailers if t.dispatched]
+
+                    # Active trailers are edited in-cell as one table instead of per-trailer widgets.
+                    # The editor sits in a form, so edits only reach the trailers on an explicit
+                    # submit and the editor's input data never changes while edits are pending.
+                    if active_trailers:
+                        st.write("🔴 **Active**")
+                        with st.form(key=f"trailers_form_{location.name}"):
+                            edited_df = st.data_editor(
+                                pd.DataFrame([
+                                    {
+                                        "Trailer": trailer.number,
+                                        "Stacks": trailer.stacks,
+                                        "LD": trailer.ld_number,
+                                        "Trailer Number": trailer.trailer_number,
+                                        "Seal Number": trailer.seal_number,
+                                        "Dispatch": False
+                                    } for trailer in active_trailers
+                                ]),
+                                key=f"trailers_{location.name}",
+                                num_rows="fixed",
+                                hide_index=True,
+                                use_container_width=True,
+                                disabled=["Trailer", "Stacks", "LD"],
+                                column_config={
+                                    "LD": st.column_config.NumberColumn(format="%d"),
+                                    "Dispatch": st.column_config.CheckboxColumn(
+                                        help="Select trailers, then click 'Dispatch Selected'"
                                     )
+                                }
+                            )
 
-                                col1, col2, col3 = st.columns(3)
-
-                                with col1:
-                                    if st.button("Save Changes", key=f"save_{trailer_key}"):
-                                        trailer.trailer_number = new_trailer_number
-                                        trailer.seal_number = new_seal_number
-                                        st.session_state[f"editing_{trailer_key}"] = False
-                                        st.rerun()
-
-                                with col2:
-                                    if st.button("Dispatch Trailer", key=f"dispatch_{trailer_key}", type="primary"):
-                                        trailer.trailer_number = new_trailer_number
-                                        trailer.seal_number = new_seal_number
-                                        trailer.dispatched = True
-                                        trailer.dispatch_timestamp = datetime.now().isoformat()
-                                        st.session_state[f"editing_{trailer_key}"] = False
-                                        st.success(f"✅ Trailer #{trailer.number} dispatched!")
-                                        st.rerun()
-
-                                with col3:
-                                    if st.button("Cancel", key=f"cancel_{trailer_key}"):
-                                        st.session_state[f"editing_{trailer_key}"] = False
-                                        st.rerun()
-
-                                st.markdown("---")
+                            col1, col2 = st.columns(2)
+                            with col1:
+                                save_clicked = st.form_submit_button("Save Changes")
+                            with col2:
+                                dispatch_clicked = st.form_submit_button("Dispatch Selected", type="primary")
+
+                        # Apply the edited rows back to the trailer objects on submit only
+                        if save_clicked or dispatch_clicked:
+                            for trailer, row in zip(active_trailers, edited_df.to_dict("records")):
+                                trailer.trailer_number = row["Trailer Number"] or ""
+                                trailer.seal_number = row["Seal Number"] or ""
+                                if dispatch_clicked and row["Dispatch"]:
+                                    trailer.dispatched = True
+                                    trailer.dispatch_timestamp = datetime.now().isoformat()
+                            st.rerun()
+
+                    # Dispatched trailers are locked and shown read-only
+                    if dispatched_trailers:
+                        st.write("🟢 **Dispatched**")
+                        st.dataframe(
+                            pd.DataFrame([
+                                {
+                                    "Trailer": trailer.number,
+                                    "Stacks": trailer.stacks,
+                                    "LD": trailer.ld_number,
+                                    "Trailer Number": trailer.trailer_number,
+                                    "Seal Number": trailer.seal_number,
+                                    "Dispatched": trailer.dispatch_timestamp
+                                } for trailer in dispatched_trailers
+                            ]),
+                            hide_index=True,
+                            use_container_width=True,
+                            column_config={"LD": st.column_config.NumberColumn(format="%d")}
+                        )
 
         # Inbound Trailers Analysis
         if st.session_state.current_locations:
@@ -9,19 +9,34 @@ Features:
 - Product-specific calculations for optimal trailer utilization
 """
 
+import itertools
 import json
-import math
-import random
+import sys
+from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime
 
+import numpy as np
+
+try:
+    import orjson  # Fast JSON parsing/serialization when installed
+except ImportError:
+    orjson = None
+
+# Locations that should have guaranteed large orders (2+ trailers)
+_LARGE_ORDER_LOCATIONS = frozenset({'Greenville', 'Anderson', 'Gastonia', 'Spartanburg'})
+
+# Column widths for the product table in the interactive interface
+_W_NAME, _W_NUMBER, _W_UNITS, _W_STACK, _W_TYPE = 25, 12, 10, 12, 12
+
 
 # ============================================================================
 # DATA MODELS
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Product:
     """Product model with configuration data."""
     name: str
@@ -32,14 +47,14 @@ class Product:
     origin_plant: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Route:
     """Route model for delivery locations."""
     route_id: int  # Route number (e.g., 6278, 5539)
     location: str  # Warehouse location (e.g., Anderson, Galax)
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderItem:
     """Individual item within an order."""
     product_number: int
@@ -52,7 +67,7 @@ class OrderItem:
     tray_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Complete order with items and totals."""
     order_id: str
@@ -63,6 +78,134 @@ class Order:
     total_trays: int
     total_stacks: int
 
+    @property
+    def date_only(self) -> str:
+        """Date part (YYYY-MM-DD) of order_date."""
+        return self.order_date[:10]
+
+
+# ============================================================================
+# JSON HELPERS
+# ============================================================================
+
+def read_json_file(path: str):
+    """Parse a JSON file, using orjson when available."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _dataclass_fields(obj) -> Dict:
+    """Shallow field mapping for a (slotted) dataclass; json recurses into nested items."""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+def write_json_file(path: str, data) -> None:
+    """Write data as indented JSON, serializing dataclasses directly."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, default=_dataclass_fields)
+
+
+def _write_orders_ndjson(path: str, orders, export_date: str) -> None:
+    """
+    Write orders as newline-delimited JSON: an export header line, then one order per line.
+    
+    Each order is encoded and written on its own, so peak memory is one
+    encoded order rather than the whole file.
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps({"export_date": export_date}) + b'\n')
+            for order in orders:
+                f.write(orjson.dumps(order) + b'\n')
+        return
+
+    with open(path, 'w') as f:
+        f.write(json.dumps({"export_date": export_date}) + '\n')
+        for order in orders:
+            f.write(json.dumps(order, default=_dataclass_fields) + '\n')
+
+
+def _iter_order_records(path: str):
+    """
+    Yield order dicts from an orders file.
+    
+    NDJSON files (a header line without an "orders" key) are parsed one line
+    at a time; older single-document {"orders": [...]} files are parsed whole.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(path, 'rb') as f:
+        first_line = f.readline()
+        try:
+            header = loads(first_line)
+        except ValueError:
+            header = None  # First line of an indented single document
+
+        if isinstance(header, dict) and "orders" not in header:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+            return
+
+        data = loads(first_line + f.read())
+    yield from data.get("orders", [])
+
+
+# ============================================================================
+# QUANTITY CALCULATIONS
+# ============================================================================
+
+@lru_cache(maxsize=8192)
+def _calc_qty(units_per_tray: int, stack_height: int, units_ordered: int) -> Tuple[int, int]:
+    """
+    Calculate (trays_needed, stacks_needed) for a product configuration.
+    
+    Memoized because simulated orders repeat the same few quantities.
+    Uses integer ceiling division to stay out of float math.
+    """
+    trays_needed = -(-units_ordered // units_per_tray)
+    stacks_needed = -(-trays_needed // stack_height)
+    return trays_needed, stacks_needed
+
+
+# ============================================================================
+# DATE FORMATTING
+# ============================================================================
+
+@lru_cache(maxsize=256)
+def _parse_order_date(order_date: str) -> Optional[datetime]:
+    """Parse an MM/DD/YYYY date string, or None if it is invalid."""
+    try:
+        return datetime.strptime(order_date, "%m/%d/%Y")
+    except ValueError:
+        return None
+
+
+def _format_order_date(order_date: Optional[str], day_number: Optional[int], now: datetime) -> str:
+    """
+    Build the stored order date string.
+    
+    Args:
+        order_date: Optional date string in MM/DD/YYYY format
+        day_number: Optional day number
+        now: Timestamp of the order
+        
+    Returns:
+        Formatted date string
+    """
+    # Use provided date (MM/DD/YYYY) or current date
+    base_date = (order_date and _parse_order_date(order_date)) or now
+
+    if day_number:
+        return f"{base_date:%Y-%m-%d} Day {day_number} {now:%H:%M:%S}"
+    return f"{base_date:%Y-%m-%d %H:%M:%S}"
+
 
 # ============================================================================
 # ORDER SYSTEM
@@ -82,7 +225,15 @@ class OrderSystem:
         self.routes_file = routes_file
         self.products = {}
         self.routes = {}
+        self._routes_by_location = {}  # location -> routes, built once in load_data
+        self._locations_sorted = ()  # Sorted location names, built once in load_data
+        self._routes_tuple = ()  # Snapshot of routes, built once in load_data
+        self._products_tuple = ()  # Snapshot of products, built once in load_data
+        self._upt = np.empty(0, dtype=np.int64)  # units_per_tray by _products_tuple position
+        self._sh = np.empty(0, dtype=np.int64)  # stack_height by _products_tuple position
         self.orders = {}
+        self.revision = 0  # Bumped whenever orders are added, so dependents can refresh caches
+        self._order_counter = itertools.count(1)  # Sequence for unique order IDs
         self.load_data()
 
     def load_data(self) -> bool:
@@ -94,22 +245,28 @@ class OrderSystem:
         """
         try:
             # Load products
-            with open(self.products_file, 'r') as f:
-                products_data = json.load(f)
-                for product_data in products_data:
-                    product = Product(**product_data)
-                    self.products[product.product_number] = product
+            products_data = read_json_file(self.products_file)
+            for product_data in products_data:
+                product = Product(**product_data)
+                self.products[product.product_number] = product
 
             # Load routes
-            with open(self.routes_file, 'r') as f:
-                routes_data = json.load(f)
-                for location, route_numbers in routes_data.items():
-                    for route_number in route_numbers:
-                        route = Route(
-                            route_id=route_number,
-                            location=location
-                        )
-                        self.routes[route_number] = route
+            routes_data = read_json_file(self.routes_file)
+            routes_by_location = {}
+            for location, route_numbers in routes_data.items():
+                for route_number in route_numbers:
+                    route = Route(
+                        route_id=route_number,
+                        location=location
+                    )
+                    self.routes[route_number] = route
+                    routes_by_location.setdefault(location, []).append(route)
+            self._routes_by_location = routes_by_location
+            self._locations_sorted = tuple(sorted(routes_by_location))
+            self._routes_tuple = tuple(self.routes.values())
+            self._products_tuple = tuple(self.products.values())
+            self._upt = np.array([p.units_per_tray for p in self._products_tuple], dtype=np.int64)
+            self._sh = np.array([p.stack_height for p in self._products_tuple], dtype=np.int64)
 
             print(f"Loaded {len(self.products)} products and {len(self.routes)} routes.")
             return True
@@ -127,28 +284,20 @@ class OrderSystem:
 
     def get_routes_for_location(self, location: str) -> List[Route]:
         """Get all routes available for a specific location."""
-        location_routes = []
-        for route in self.routes.values():
-            if route.location == location:
-                location_routes.append(route)
-        return location_routes
+        return list(self._routes_by_location.get(location, []))
 
     def get_available_locations(self) -> List[str]:
         """Get all available locations."""
-        locations = set()
-        for route in self.routes.values():
-            locations.add(route.location)
-        return sorted(list(locations))
+        return list(self._locations_sorted)
 
-    def get_products_for_route(self, route_id: int) -> List[Product]:
+    def get_products_for_route(self, route_id: int) -> Tuple[Product, ...]:
         """
         Get all products available for a specific route.
         
-        Note: All products are available for every route.
+        Note: All products are available for every route, so the shared
+        read-only products snapshot is returned.
         """
-        if route_id not in self.routes:
-            return []
-        return list(self.products.values())
+        return self._products_tuple if route_id in self.routes else ()
 
     def simulate_random_orders(self, max_products_per_order: int = 50, order_date: str = None, day_number: int = None) -> List[Order]:
         """
@@ -163,65 +312,111 @@ class OrderSystem:
             List of generated Order objects
         """
         simulated_orders = []
-        routes = list(self.routes.values())
-        products = list(self.products.values())
-
-        # Define locations that should have guaranteed large orders (2+ trailers)
-        large_order_locations = ['Greenville', 'Anderson', 'Gastonia', 'Spartanburg']
-
-        for route in routes:
-            # Select random products (1 to max_products_per_order)
-            # Limit to realistic demo size - max 5 products per order
-            num_products = random.randint(1, min(5, max_products_per_order, len(products)))
-            selected_products = random.sample(products, num_products)
-
+        routes = self._routes_tuple
+        products = self._products_tuple
+
+        # One timestamp, date string and ID stamp for the whole batch
+        now = datetime.now()
+        formatted_date = _format_order_date(order_date, day_number, now)
+        stamp = f"{now:%Y%m%d_%H%M%S}"
+
+        # Draw every random decision for the batch up front in vectorized NumPy calls
+        rng = np.random.default_rng()
+        num_routes = len(routes)
+
+        # Select random products (1 to max_products_per_order)
+        # Limit to realistic demo size - max 5 products per order
+        max_items = min(5, max_products_per_order, len(products))
+        num_products = rng.integers(1, max_items + 1, size=num_routes).tolist()
+
+        # Per-route sample of product indices (no repeats within an order):
+        # partition out the max_items smallest random keys per row instead of
+        # sorting the whole row, then order just those few
+        keys = rng.random((num_routes, len(products)))
+        picked = np.argpartition(keys, max_items - 1, axis=1)[:, :max_items]
+        order = np.argsort(np.take_along_axis(keys, picked, axis=1), axis=1)
+        product_indices = np.take_along_axis(picked, order, axis=1)
+
+        # Generate random tray counts; units are then multiples of units_per_tray
+        # Guarantee large orders for specific locations (2-3 trailers max)
+        # We need 100-200 stacks total to get 2-3 trailers (realistic demo)
+        # With stack heights of 17-20, we need 1700-4000 trays total
+        # With 5 products max, each product needs 100-200 trays
+        # Regular random orders for other locations use 1-20 trays
+        is_large = np.array([route.location in _LARGE_ORDER_LOCATIONS for route in routes], dtype=bool)
+        low = np.where(is_large, 100, 1)[:, None]
+        high = np.where(is_large, 201, 21)[:, None]
+        tray_counts = rng.integers(low, high, size=(num_routes, max_items))
+
+        # Units are exact multiples of units_per_tray, so the whole batch's
+        # quantities come from the per-product arrays in one vectorized pass
+        units_ordered, stacks_needed = self._bulk_calc(product_indices, tray_counts)
+
+        for route, count, indices, trays, units, stacks in zip(
+            routes, num_products, product_indices.tolist(), tray_counts.tolist(),
+            units_ordered.tolist(), stacks_needed.tolist()
+        ):
             order_items = []
-            for product in selected_products:
-                # Generate random units that are multiples of units_per_tray
-                if route.location in large_order_locations:
-                    # Guarantee large orders for specific locations (2-3 trailers max)
-                    # We need 100-200 stacks total to get 2-3 trailers (realistic demo)
-                    # With stack heights of 17-20, we need 1700-4000 trays total
-                    # With 5 products max, each product needs 100-200 trays
-                    min_trays = 100
-                    max_trays = 200
-                else:
-                    # Regular random orders for other locations
-                    min_trays = 1
-                    max_trays = 20
-
-                num_trays = random.randint(min_trays, max_trays)
-                units_ordered = num_trays * product.units_per_tray
-
-                order_items.append({
-                    'product_number': product.product_number,
-                    'units_ordered': units_ordered
-                })
+            for index, num_trays, num_units, num_stacks in zip(indices[:count], trays, units, stacks):
+                product = products[index]
+                order_items.append(OrderItem(
+                    product_number=product.product_number,
+                    product_name=product.name,
+                    units_ordered=num_units,
+                    units_per_tray=product.units_per_tray,
+                    trays_needed=num_trays,
+                    stack_height=product.stack_height,
+                    stacks_needed=num_stacks,
+                    tray_type=product.tray_type
+                ))
 
             # Create the order for this route
-            order = self.create_order(route.route_id, order_items, order_date, day_number)
-            if order:
-                simulated_orders.append(order)
+            order = self._store_order(
+                route, order_items, sum(trays[:count]), sum(stacks[:count]),
+                day_number, formatted_date, stamp
+            )
+            simulated_orders.append(order)
 
         return simulated_orders
 
+    def _bulk_calc(self, product_indices: np.ndarray, tray_counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized quantities for whole trays of products.
+        
+        Args:
+            product_indices: Positions into the products snapshot
+            tray_counts: Trays ordered, same shape as product_indices
+            
+        Returns:
+            Tuple of (units_ordered, stacks_needed) arrays
+        """
+        units_ordered = tray_counts * self._upt[product_indices]
+        stack_height = self._sh[product_indices]
+        stacks_needed = -(-tray_counts // stack_height)
+        return units_ordered, stacks_needed
+
     def get_system_stats(self) -> Dict:
         """Get system statistics for demo purposes."""
         stats = {
             'total_products': len(self.products),
             'total_routes': len(self.routes),
-            'total_locations': len(self.get_available_locations()),
+            'total_locations': len(self._routes_by_location),
             'total_orders': len(self.orders)
         }
 
         if self.orders:
-            stats['total_trays'] = sum(order.total_trays for order in self.orders.values())
-            stats['total_stacks'] = sum(order.total_stacks for order in self.orders.values())
-
-        stats['locations'] = {}
-        for location in sorted(self.get_available_locations()):
-            routes_in_location = len([r for r in self.routes.values() if r.location == location])
-            stats['locations'][location] = routes_in_location
+            # One pass over the orders for both totals
+            total_trays = total_stacks = 0
+            for order in self.orders.values():
+                total_trays += order.total_trays
+                total_stacks += order.total_stacks
+            stats['total_trays'] = total_trays
+            stats['total_stacks'] = total_stacks
+
+        stats['locations'] = {
+            location: len(self._routes_by_location[location])
+            for location in self._locations_sorted
+        }
 
         return stats
 
@@ -236,18 +431,31 @@ class OrderSystem:
         Returns:
             Tuple of (trays_needed, stacks_needed)
         """
-        if product_number not in self.products:
+        product = self.products.get(product_number)
+        if product is None:
             return 0, 0
 
-        product = self.products[product_number]
-
-        # Calculate trays needed (using ceiling to round up)
-        trays_needed = math.ceil(units_ordered / product.units_per_tray)
+        return _calc_qty(product.units_per_tray, product.stack_height, units_ordered)
 
-        # Calculate stacks needed
-        stacks_needed = math.ceil(trays_needed / product.stack_height)
-
-        return trays_needed, stacks_needed
+    def _next_order_id(self, day_number: Optional[int], stamp: str) -> str:
+        """
+        Build the next unique order ID.
+        
+        Args:
+            day_number: Optional day number
+            stamp: Creation timestamp (YYYYMMDD_HHMMSS), shared across a batch
+            
+        Returns:
+            Order ID string
+        """
+        # Create order ID with day number if provided. The timestamp keeps IDs
+        # from separate sessions apart in shared order files, and the sequence
+        # keeps them unique when many orders are created within the same second
+        while True:
+            seq = next(self._order_counter)
+            order_id = f"ORD_D{day_number}_{stamp}_{seq:06d}" if day_number else f"ORD_{stamp}_{seq:06d}"
+            if order_id not in self.orders:  # Skip IDs taken by loaded orders
+                return order_id
 
     def create_order(self, route_id: int, order_items: List[Dict], order_date: str = None, day_number: int = None) -> Optional[Order]:
         """
@@ -262,47 +470,41 @@ class OrderSystem:
         Returns:
             Order object if successful, None otherwise
         """
-        if route_id not in self.routes:
+        route = self.routes.get(route_id)
+        if route is None:
             return None
 
-        route = self.routes[route_id]
-        
-        # Create order ID with day number if provided
-        if day_number:
-            order_id = f"ORD_D{day_number}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        else:
-            order_id = f"ORD_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # Validate order items up front so the builder loop has no skips
+        products = self.products
+        validated_items = [
+            (product, units_ordered)
+            for product, units_ordered in (
+                (products.get(item.get('product_number')), item.get('units_ordered', 0))
+                for item in order_items
+            )
+            if product is not None and units_ordered > 0
+        ]
 
-        # Validate and process order items
         processed_items = []
         total_trays = 0
         total_stacks = 0
 
-        for item in order_items:
-            product_number = item.get('product_number')
-            units_ordered = item.get('units_ordered', 0)
-
-            if product_number not in self.products:
-                continue
-
-            if units_ordered <= 0:
-                continue
-
-            product = self.products[product_number]
-            trays_needed, stacks_needed = self.calculate_order_quantities(product_number, units_ordered)
-
-            # Validate that units are in increments of units_per_tray
-            if units_ordered % product.units_per_tray != 0:
-                units_ordered = math.ceil(units_ordered / product.units_per_tray) * product.units_per_tray
-                trays_needed, stacks_needed = self.calculate_order_quantities(product_number, units_ordered)
+        calc_qty = _calc_qty
+        for product, units_ordered in validated_items:
+            units_per_tray = product.units_per_tray
+            stack_height = product.stack_height
+            # Trays are rounded up, so units always land on a multiple of
+            # units_per_tray; exact multiples come through unchanged
+            trays_needed, stacks_needed = calc_qty(units_per_tray, stack_height, units_ordered)
+            units_ordered = trays_needed * units_per_tray
 
             order_item = OrderItem(
-                product_number=product_number,
+                product_number=product.product_number,
                 product_name=product.name,
                 units_ordered=units_ordered,
-                units_per_tray=product.units_per_tray,
+                units_per_tray=units_per_tray,
                 trays_needed=trays_needed,
-                stack_height=product.stack_height,
+                stack_height=stack_height,
                 stacks_needed=stacks_needed,
                 tray_type=product.tray_type
             )
@@ -314,37 +516,28 @@ class OrderSystem:
         if not processed_items:
             return None
 
-        # Use provided date or current date
-        if order_date:
-            # Convert MM/DD/YYYY to YYYY-MM-DD format
-            try:
-                parsed_date = datetime.strptime(order_date, "%m/%d/%Y")
-                if day_number:
-                    formatted_date = f"{parsed_date.strftime('%Y-%m-%d')} Day {day_number} {datetime.now().strftime('%H:%M:%S')}"
-                else:
-                    formatted_date = parsed_date.strftime('%Y-%m-%d %H:%M:%S')
-            except ValueError:
-                if day_number:
-                    formatted_date = f"{datetime.now().strftime('%Y-%m-%d')} Day {day_number} {datetime.now().strftime('%H:%M:%S')}"
-                else:
-                    formatted_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        else:
-            if day_number:
-                formatted_date = f"{datetime.now().strftime('%Y-%m-%d')} Day {day_number} {datetime.now().strftime('%H:%M:%S')}"
-            else:
-                formatted_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        now = datetime.now()
+        formatted_date = _format_order_date(order_date, day_number, now)
+        return self._store_order(route, processed_items, total_trays, total_stacks,
+                                 day_number, formatted_date, f"{now:%Y%m%d_%H%M%S}")
+
+    def _store_order(self, route: Route, items: List[OrderItem], total_trays: int, total_stacks: int,
+                     day_number: Optional[int], formatted_date: str, stamp: str) -> Order:
+        """Assign an ID to fully computed order items and store the order."""
+        order_id = self._next_order_id(day_number, stamp)
 
         order = Order(
             order_id=order_id,
-            route_id=route_id,
+            route_id=route.route_id,
             location=route.location,
             order_date=formatted_date,
-            items=processed_items,
+            items=items,
             total_trays=total_trays,
             total_stacks=total_stacks
         )
 
         self.orders[order_id] = order
+        self.revision += 1
         return order
 
     def get_order(self, order_id: str) -> Optional[Order]:
@@ -355,21 +548,26 @@ class OrderSystem:
         """Get all orders."""
         return list(self.orders.values())
 
+    def iter_orders(self):
+        """Iterate over all orders without copying them into a list."""
+        return self.orders.values()
+
     @staticmethod
     def get_order_summary(order: Order) -> str:
         """Get a detailed summary of an order."""
-        summary = f"Order ID: {order.order_id}\n"
-        summary += f"Route: {order.route_id}\n"
-        summary += f"Location: {order.location}\n"
-        summary += f"Order Date: {order.order_date}\n"
-        summary += f"Total Trays: {order.total_trays}\n"
-        summary += f"Total Stacks: {order.total_stacks}\n"
-        summary += f"Items: {len(order.items)}"
-        return summary
+        return "\n".join((
+            f"Order ID: {order.order_id}",
+            f"Route: {order.route_id}",
+            f"Location: {order.location}",
+            f"Order Date: {order.order_date}",
+            f"Total Trays: {order.total_trays}",
+            f"Total Stacks: {order.total_stacks}",
+            f"Items: {len(order.items)}",
+        ))
 
     def save_orders_to_file(self, filename: str = None) -> str:
         """
-        Save all orders to a JSON file.
+        Save all orders to a newline-delimited JSON file.
         
         Args:
             filename: Optional filename, auto-generated if not provided
@@ -380,19 +578,14 @@ class OrderSystem:
         if filename is None:
             filename = f"orders_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
-        orders_data = {
-            "orders": [asdict(order) for order in self.orders.values()],
-            "export_date": datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
-
-        with open(filename, 'w') as f:
-            json.dump(orders_data, f, indent=2)
+        # Orders are dataclasses and are streamed one per line without an asdict() copy
+        _write_orders_ndjson(filename, self.orders.values(), datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
 
         return filename
 
     def load_orders_from_file(self, filename: str) -> bool:
         """
-        Load orders from a JSON file.
+        Load orders from a JSON file (NDJSON or the older single-document layout).
         
         Args:
             filename: JSON file to load from
@@ -401,17 +594,15 @@ class OrderSystem:
             True if successful, False otherwise
         """
         try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
-
             loaded_count = 0
-            for order_data in data.get("orders", []):
+            for order_data in _iter_order_records(filename):
                 # Convert items back to OrderItem objects
                 items = [OrderItem(**item_data) for item_data in order_data["items"]]
                 order_data["items"] = items
 
                 order = Order(**order_data)
                 self.orders[order.order_id] = order
+                self.revision += 1
                 loaded_count += 1
 
             return True
@@ -450,10 +641,10 @@ def main():
 
         if choice == "1":
             routes = order_system.get_available_routes()
-            print(f"\nAvailable Routes ({len(routes)}):")
-            print("-" * 50)
-            for i, route in enumerate(routes, 1):
-                print(f"{i}. Route {route.route_id} - {route.location}")
+            # Build the listing and write it in one call
+            lines = [f"\nAvailable Routes ({len(routes)}):", "-" * 50]
+            lines.extend(f"{i}. Route {route.route_id} - {route.location}" for i, route in enumerate(routes, 1))
+            sys.stdout.write("\n".join(lines) + "\n")
 
         elif choice == "2":
             routes = order_system.get_available_routes()
@@ -470,13 +661,21 @@ def main():
                 selected_route = routes[route_choice]
                 products = order_system.get_products_for_route(selected_route.route_id)
 
-                print(f"\nProducts available for Route {selected_route.route_id} ({selected_route.location}):")
-                print("-" * 80)
-                print(f"{'Product Name':<25} {'Product #':<12} {'Units/Tray':<10} {'Stack Height':<12} {'Tray Type':<12}")
-                print("-" * 80)
-
-                for product in products:
-                    print(f"{product.name:<25} {product.product_number:<12} {product.units_per_tray:<10} {product.stack_height:<12} {product.tray_type:<12}")
+                # Pad cells with str.ljust on fixed widths and write the table in one call
+                lines = [
+                    f"\nProducts available for Route {selected_route.route_id} ({selected_route.location}):",
+                    "-" * 80,
+                    f"{'Product Name'.ljust(_W_NAME)} {'Product #'.ljust(_W_NUMBER)} {'Units/Tray'.ljust(_W_UNITS)} "
+                    f"{'Stack Height'.ljust(_W_STACK)} {'Tray Type'.ljust(_W_TYPE)}",
+                    "-" * 80,
+                ]
+                lines.extend(
+                    f"{product.name.ljust(_W_NAME)} {str(product.product_number).ljust(_W_NUMBER)} "
+                    f"{str(product.units_per_tray).ljust(_W_UNITS)} {str(product.stack_height).ljust(_W_STACK)} "
+                    f"{product.tray_type.ljust(_W_TYPE)}"
+                    for product in products
+                )
+                sys.stdout.write("\n".join(lines) + "\n")
 
             except (ValueError, IndexError):
                 print("Invalid route selection.")
@@ -487,7 +686,7 @@ def main():
             print("="*50)
             print("This will create random orders for EVERY SINGLE ROUTE available.")
             print("Units are ordered in multiples of units_per_tray for each product.")
-            print(f"Total routes available: {len(order_system.get_available_routes())}")
+            print(f"Total routes available: {len(order_system.routes)}")
 
             try:
                 max_products = int(input("Max products per order? (default 3): ") or "3")
@@ -499,18 +698,18 @@ def main():
                 print("(One order for each route)")
 
                 # Show summary by location
-                location_summary = {}
+                # location -> [orders, trays, stacks]
+                location_summary = defaultdict(lambda: [0, 0, 0])
                 for order in simulated_orders:
-                    if order.location not in location_summary:
-                        location_summary[order.location] = {'orders': 0, 'trays': 0, 'stacks': 0}
-                    location_summary[order.location]['orders'] += 1
-                    location_summary[order.location]['trays'] += order.total_trays
-                    location_summary[order.location]['stacks'] += order.total_stacks
+                    stats = location_summary[order.location]
+                    stats[0] += 1
+                    stats[1] += order.total_trays
+                    stats[2] += order.total_stacks
 
                 print(f"\nSummary by Location:")
                 print("-" * 60)
-                for location, stats in sorted(location_summary.items()):
-                    print(f"{location}: {stats['orders']} orders, {stats['trays']} trays, {stats['stacks']} stacks")
+                for location, (num_orders, trays, stacks) in sorted(location_summary.items()):
+                    print(f"{location}: {num_orders} orders, {trays} trays, {stacks} stacks")
 
                 print(f"\nAll orders have been added to the system.")
                 print("Use option 4 to view detailed order information.")
@@ -524,14 +723,15 @@ def main():
                 print("No orders created yet.")
                 continue
 
-            print(f"\nAll Orders ({len(orders)}):")
-            print("-" * 80)
+            # Build the listing and write it in one call
+            lines = [f"\nAll Orders ({len(orders)}):", "-" * 80]
             for order in orders:
-                print(f"Order ID: {order.order_id}")
-                print(f"Route: {order.route_id} | Location: {order.location}")
-                print(f"Date: {order.order_date}")
-                print(f"Items: {len(order.items)} | Total Trays: {order.total_trays} | Total Stacks: {order.total_stacks}")
-                print("-" * 80)
+                lines.append(f"Order ID: {order.order_id}")
+                lines.append(f"Route: {order.route_id} | Location: {order.location}")
+                lines.append(f"Date: {order.order_date}")
+                lines.append(f"Items: {len(order.items)} | Total Trays: {order.total_trays} | Total Stacks: {order.total_stacks}")
+                lines.append("-" * 80)
+            sys.stdout.write("\n".join(lines) + "\n")
 
         elif choice == "5":
             if not order_system.orders:
@@ -552,13 +752,16 @@ def main():
 
         elif choice == "6":
             stats = order_system.get_system_stats()
-            print(f"Total Products: {stats['total_products']}")
-            print(f"Total Routes: {stats['total_routes']}")
-            print(f"Total Locations: {stats['total_locations']}")
-            print(f"Total Orders: {stats['total_orders']}")
+            lines = [
+                f"Total Products: {stats['total_products']}",
+                f"Total Routes: {stats['total_routes']}",
+                f"Total Locations: {stats['total_locations']}",
+                f"Total Orders: {stats['total_orders']}",
+            ]
             if 'total_trays' in stats:
-                print(f"Total Trays: {stats['total_trays']}")
-                print(f"Total Stacks: {stats['total_stacks']}")
+                lines.append(f"Total Trays: {stats['total_trays']}")
+                lines.append(f"Total Stacks: {stats['total_stacks']}")
+            sys.stdout.write("\n".join(lines) + "\n")
 
         elif choice == "7":
             if not order_system.orders:
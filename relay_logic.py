@@ -9,17 +9,39 @@ Features:
 - Real-time dispatch tracking
 """
 
-from math import ceil
-import random
-import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 import os
 import sys
 
+import numpy as np
+
 # Add the current directory to the path to import orders
 sys.path.append(os.path.dirname(__file__))
-from orders import OrderSystem, Order, OrderItem
+from orders import OrderSystem, Order
+
+# Stack capacity of a single trailer
+_TRAILER_CAPACITY = 98
+
+# Banner lines used by the display methods
+_BAR80 = "=" * 80
+_BAR60 = "=" * 60
+_DASH40 = "-" * 40
+
+# LD numbers are 9-digit values drawn in batches
+_LD_POOL_SIZE = 4096
+_rng = np.random.default_rng()
+_ld_pool = iter(())
+
+
+def _next_ld_number() -> int:
+    """Return the next random LD number, refilling the pool in one draw when empty."""
+    global _ld_pool
+    try:
+        return next(_ld_pool)
+    except StopIteration:
+        _ld_pool = iter(_rng.integers(100000000, 1000000000, size=_LD_POOL_SIZE).tolist())
+        return next(_ld_pool)
 
 
 # ============================================================================
@@ -43,7 +65,7 @@ class Trailer:
         self.stacks = stacks
         self.overload_from = overload_from
         self.order_info = order_info  # Store order information for automated relays
-        self.ld_number = random.randint(100000000, 999999999)
+        self.ld_number = _next_ld_number()
         self.trailer_number = ""
         self.seal_number = ""
         self.dispatched = False  # Track if trailer has been dispatched
@@ -73,11 +95,13 @@ class Location:
         self.bulk_trays = bulk_trays
         self.cake_pallets = cake_pallets
         self.orders = orders or []  # Store orders for automated relay creation
-        self.total_bread_stacks = ceil(bread_trays / 17) if bread_trays > 0 else 0
-        self.total_bulk_stacks = ceil(bulk_trays / 30) if bulk_trays > 0 else 0
+        self.total_bread_stacks = (bread_trays + 16) // 17 if bread_trays > 0 else 0  # 17 trays per bread stack
+        self.total_bulk_stacks = (bulk_trays + 29) // 30 if bulk_trays > 0 else 0  # 30 trays per bulk stack
         self.total_stacks = self.total_bread_stacks + self.total_bulk_stacks
         self.total_trays = (bread_trays + bulk_trays) if (bread_trays or bulk_trays) else 0
         self.trailers = []
+        self._trailer_by_number = {}  # trailer number -> Trailer, built in assign_trailers
+        self.display_label = f"{self.name} - 0 trailers"  # Header label for the web interface
 
     def assign_trailers(self, order_info: Optional[List[Order]] = None):
         """
@@ -86,13 +110,22 @@ class Location:
         Args:
             order_info: Optional order information for automated relay creation
         """
-        stacks_remaining = self.total_stacks
-        trailer_number = 1
-        while stacks_remaining > 0:
-            count = min(stacks_remaining, 98)  # 98-stack capacity limit
-            self.trailers.append(Trailer(trailer_number, count, order_info=order_info))
-            stacks_remaining -= count
-            trailer_number += 1
+        # Full trailers plus one partial trailer for any remainder
+        full, remainder = divmod(max(self.total_stacks, 0), _TRAILER_CAPACITY)
+        self.trailers.extend(
+            Trailer(number, _TRAILER_CAPACITY, order_info=order_info)
+            for number in range(1, full + 1)
+        )
+        if remainder:
+            self.trailers.append(Trailer(full + 1, remainder, order_info=order_info))
+        self._trailer_by_number = {trailer.number: trailer for trailer in self.trailers}
+
+        # Trailer count is fixed from here on, so build the header label once
+        self.display_label = f"{self.name} - {len(self.trailers)} trailers"
+
+    def get_trailer(self, number: int) -> Optional[Trailer]:
+        """Get a trailer by its number, or None if there is no such trailer."""
+        return self._trailer_by_number.get(number)
 
     @classmethod
     def from_orders(cls, location_name: str, orders: List[Order]) -> 'Location':
@@ -106,14 +139,9 @@ class Location:
         Returns:
             Location object with assigned trailers
         """
-        total_trays = 0
-        total_stacks = 0
-
-        # Calculate totals from orders
-        for order in orders:
-            for item in order.items:
-                total_trays += item.trays_needed
-                total_stacks += item.stacks_needed
+        # Calculate totals from the per-order totals computed at order creation
+        total_trays = sum(order.total_trays for order in orders)
+        total_stacks = sum(order.total_stacks for order in orders)
 
         location = cls(
             name=location_name,
@@ -139,8 +167,9 @@ class Location:
             trailer.bread_trays = None
             trailer.bulk_trays = None
 
-    def display_relay(self):
-        """Display relay information for this location."""
+    def relay_lines(self) -> List[str]:
+        """Build the relay display lines for this location."""
+        lines = []
         for trailer in self.trailers:
             # If trailer has an overload, output overload info
             overload_text = f"- Overload [{trailer.overload_from[0]} {trailer.overload_from[1]} stacks]" if trailer.overload_from else ""
@@ -150,30 +179,48 @@ class Location:
             if trailer.order_info:
                 order_text = f" (Auto-generated from {len(trailer.order_info)} orders)"
 
-            # Print trailer details (LD number, stack count)
-            print(f"{self.name}:\nLD {trailer.ld_number} - Trailer #{trailer.number}: {trailer.stacks} stacks {overload_text}{order_text}")
-            # Print empty input fields for trailer number and seal number
-            print(f" Trailer #: [ {trailer.trailer_number} ] Seal #: [ {trailer.seal_number} ]")
+            # Trailer details (LD number, stack count)
+            lines.append(f"{self.name}:\nLD {trailer.ld_number} - Trailer #{trailer.number}: {trailer.stacks} stacks {overload_text}{order_text}")
+            # Empty input fields for trailer number and seal number
+            lines.append(f" Trailer #: [ {trailer.trailer_number} ] Seal #: [ {trailer.seal_number} ]")
+        return lines
 
-    def display_order_details(self):
-        """Display detailed order information for automated relays."""
+    def order_detail_lines(self) -> List[str]:
+        """Build the order detail display lines for this location."""
         if not self.orders:
-            return
+            return []
 
-        print(f"\n{'='*60}")
-        print(f"ORDER DETAILS FOR {self.name.upper()}")
-        print(f"{'='*60}")
+        lines = [
+            "\n" + _BAR60,
+            f"ORDER DETAILS FOR {self.name.upper()}",
+            _BAR60,
+        ]
 
         for order in self.orders:
-            print(f"\nOrder ID: {order.order_id}")
-            print(f"Route: {order.route_id} | Date: {order.order_date}")
-            print(f"Total Trays: {order.total_trays} | Total Stacks: {order.total_stacks}")
-            print("-" * 40)
+            lines.append(f"\nOrder ID: {order.order_id}")
+            lines.append(f"Route: {order.route_id} | Date: {order.order_date}")
+            lines.append(f"Total Trays: {order.total_trays} | Total Stacks: {order.total_stacks}")
+            lines.append(_DASH40)
+
+            lines.extend(
+                f"  {item.product_name}: {item.units_ordered} units, {item.trays_needed} trays, {item.stacks_needed} stacks"
+                for item in order.items
+            )
+
+        lines.append(_BAR60)
+        return lines
 
-            for item in order.items:
-                print(f"  {item.product_name}: {item.units_ordered} units, {item.trays_needed} trays, {item.stacks_needed} stacks")
+    def display_relay(self):
+        """Display relay information for this location."""
+        lines = self.relay_lines()
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
-        print(f"{'='*60}")
+    def display_order_details(self):
+        """Display detailed order information for automated relays."""
+        lines = self.order_detail_lines()
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ============================================================================
@@ -196,38 +243,65 @@ class RelaySystem:
         """
         self.order_system = OrderSystem()
         self.locations = []
+        self._loc_by_name = {}  # location name -> Location for the current relay
         self.orders_file_path = orders_file_path
 
+        # Date indexes over the order system's orders, rebuilt when it changes
+        self._by_date: Dict[str, List[Order]] = {}
+        self._by_date_loc: Dict[Tuple[str, str], List[Order]] = {}
+        self._stacks_by_date_loc: Dict[Tuple[str, str], int] = {}
+        self._dates_sorted: List[str] = []
+        self._locations_by_date: Dict[str, List[str]] = {}  # Sorted location names per date
+        self._indexed_system = None
+        self._indexed_revision = -1
+
         # Load orders if file path is provided
         if orders_file_path and os.path.exists(orders_file_path):
             self.order_system.load_orders_from_file(orders_file_path)
 
+    def _refresh_indexes(self):
+        """Rebuild the date indexes if orders were added or the order system was replaced."""
+        order_system = self.order_system
+        if order_system is self._indexed_system and order_system.revision == self._indexed_revision:
+            return
+
+        # Single pass over the orders fills every per-date index
+        by_date = {}
+        by_date_loc = {}
+        stacks_by_date_loc = {}
+        for order in order_system.iter_orders():
+            date = order.date_only
+            key = (date, order.location)
+            by_date.setdefault(date, []).append(order)
+            by_date_loc.setdefault(key, []).append(order)
+            stacks_by_date_loc[key] = stacks_by_date_loc.get(key, 0) + order.total_stacks
+
+        locations_by_date = {}
+        for date, location in sorted(by_date_loc):
+            locations_by_date.setdefault(date, []).append(location)
+
+        self._by_date = by_date
+        self._by_date_loc = by_date_loc
+        self._stacks_by_date_loc = stacks_by_date_loc
+        self._dates_sorted = sorted(by_date)
+        self._locations_by_date = locations_by_date
+        self._indexed_system = order_system
+        self._indexed_revision = order_system.revision
+
     def get_available_dates(self) -> List[str]:
         """Get all available dates from orders."""
-        dates = set()
-        for order in self.order_system.get_all_orders():
-            # Extract date from order_date (format: YYYY-MM-DD HH:MM:SS)
-            date_str = order.order_date.split(' ')[0]
-            dates.add(date_str)
-        return sorted(list(dates))
+        self._refresh_indexes()
+        return list(self._dates_sorted)
 
     def get_orders_by_date(self, date: str) -> List[Order]:
         """Get all orders for a specific date."""
-        orders = []
-        for order in self.order_system.get_all_orders():
-            order_date = order.order_date.split(' ')[0]
-            if order_date == date:
-                orders.append(order)
-        return orders
+        self._refresh_indexes()
+        return list(self._by_date.get(date, []))
 
     def get_orders_by_location_and_date(self, location: str, date: str) -> List[Order]:
         """Get all orders for a specific location and date."""
-        orders = []
-        for order in self.order_system.get_all_orders():
-            order_date = order.order_date.split(' ')[0]
-            if order_date == date and order.location == location:
-                orders.append(order)
-        return orders
+        self._refresh_indexes()
+        return list(self._by_date_loc.get((date, location), []))
 
     def create_automated_relay(self, date: str, day_number: Optional[int] = None) -> List[Location]:
         """
@@ -247,10 +321,8 @@ class RelaySystem:
             return []
 
         # Group orders by location
-        location_orders = {}
+        location_orders = defaultdict(list)
         for order in orders:
-            if order.location not in location_orders:
-                location_orders[order.location] = []
             location_orders[order.location].append(order)
 
         # Create Location objects from orders
@@ -260,6 +332,7 @@ class RelaySystem:
             locations.append(location)
 
         self.locations = locations
+        self._loc_by_name = {location.name: location for location in locations}
         return locations
 
     def display_relay_summary(self, date: str, day_number: Optional[int] = None):
@@ -269,9 +342,11 @@ class RelaySystem:
             return
 
         day_text = f"Day {day_number} " if day_number else ""
-        print(f"\n{'='*80}")
-        print(f"AUTOMATED RELAY SUMMARY - {day_text}{date}")
-        print(f"{'='*80}")
+        lines = [
+            "\n" + _BAR80,
+            f"AUTOMATED RELAY SUMMARY - {day_text}{date}",
+            _BAR80,
+        ]
 
         total_trailers = 0
         total_stacks = 0
@@ -280,16 +355,16 @@ class RelaySystem:
             total_trailers += len(location.trailers)
             total_stacks += location.total_stacks
 
-            print(f"\n{location.name}:")
-            print(f"  Orders: {len(location.orders)}")
-            total_trays = getattr(location, 'total_trays', sum(item.trays_needed for o in location.orders for item in o.items))
-            print(f"  Total Trays: {total_trays}")
-            print(f"  Total Stacks: {location.total_stacks}")
-            print(f"  Trailers: {len(location.trailers)}")
+            lines.append(f"\n{location.name}:")
+            lines.append(f"  Orders: {len(location.orders)}")
+            lines.append(f"  Total Trays: {location.total_trays}")
+            lines.append(f"  Total Stacks: {location.total_stacks}")
+            lines.append(f"  Trailers: {len(location.trailers)}")
 
-        print(f"\n{'='*80}")
-        print(f"TOTALS: {total_trailers} trailers, {total_stacks} stacks")
-        print(f"{'='*80}")
+        lines.append("\n" + _BAR80)
+        lines.append(f"TOTALS: {total_trailers} trailers, {total_stacks} stacks")
+        lines.append(_BAR80)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def display_full_relay(self):
         """Display the complete relay with all details."""
@@ -297,9 +372,12 @@ class RelaySystem:
             print("No relay created yet. Use 'Create Relay' first.")
             return
 
+        # Collect every location's lines and write the whole relay at once
+        lines = []
         for location in self.locations:
-            location.display_relay()
-            print()  # Add spacing between locations
+            lines.extend(location.relay_lines())
+            lines.append("")  # Add spacing between locations
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def display_order_details(self):
         """Display detailed order information for all locations."""
@@ -307,8 +385,11 @@ class RelaySystem:
             print("No relay created yet. Use 'Create Relay' first.")
             return
 
+        lines = []
         for location in self.locations:
-            location.display_order_details()
+            lines.extend(location.order_detail_lines())
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
     def add_overload(self, location_name: str, trailer_number: int, overload_from: tuple):
         """
@@ -319,21 +400,21 @@ class RelaySystem:
             trailer_number: Trailer number
             overload_from: Tuple of (location, stacks)
         """
-        for location in self.locations:
-            if location.name == location_name:
-                for trailer in location.trailers:
-                    if trailer.number == trailer_number:
-                        trailer.overload_from = overload_from
-                        print(f"Added overload to {location_name} Trailer #{trailer_number}")
-                        return
-        print(f"Trailer not found: {location_name} Trailer #{trailer_number}")
+        location = self._loc_by_name.get(location_name)
+        trailer = location.get_trailer(trailer_number) if location else None
+        if trailer is None:
+            print(f"Trailer not found: {location_name} Trailer #{trailer_number}")
+            return
+
+        trailer.overload_from = overload_from
+        print(f"Added overload to {location_name} Trailer #{trailer_number}")
 
     def interactive_menu(self):
         """Interactive menu for the relay system."""
         while True:
-            print("\n" + "="*80)
+            print("\n" + _BAR80)
             print("VIRTUAL RELAY SYSTEM - AUTOMATED")
-            print("="*80)
+            print(_BAR80)
             print("1. Create Relay (Automated from Orders)")
             print("2. View Relay Summary")
             print("3. View Full Relay")
@@ -342,7 +423,7 @@ class RelaySystem:
             print("6. Load Orders from File")
             print("7. View Available Dates")
             print("8. Exit")
-            print("="*80)
+            print(_BAR80)
 
             choice = input("Enter your choice (1-8): ").strip()
 
@@ -376,7 +457,7 @@ class RelaySystem:
 
         print(f"\nAvailable dates with orders:")
         for i, date in enumerate(dates, 1):
-            orders_count = len(self.get_orders_by_date(date))
+            orders_count = len(self._by_date[date])
             print(f"{i}. {date} ({orders_count} orders)")
 
         try:
@@ -446,14 +527,13 @@ class RelaySystem:
             return
 
         print(f"\nAvailable dates with orders:")
+        # Counts and stack totals come straight from the date indexes
         for date in dates:
-            orders = self.get_orders_by_date(date)
-            locations = set(order.location for order in orders)
-            print(f"  {date}: {len(orders)} orders, {len(locations)} locations")
-            for location in sorted(locations):
-                location_orders = [o for o in orders if o.location == location]
-                total_stacks = sum(o.total_stacks for o in location_orders)
-                print(f"    - {location}: {len(location_orders)} orders, {total_stacks} stacks")
+            locations = self._locations_by_date[date]
+            print(f"  {date}: {len(self._by_date[date])} orders, {len(locations)} locations")
+            for location in locations:
+                key = (date, location)
+                print(f"    - {location}: {len(self._by_date_loc[key])} orders, {self._stacks_by_date_loc[key]} stacks")
 
 
 # ============================================================================